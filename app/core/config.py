@@ -1,6 +1,8 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import field_validator
 from typing import List, Any
+from functools import lru_cache
+import orjson
 
 
 class Settings(BaseSettings):
@@ -17,9 +19,8 @@ class Settings(BaseSettings):
     def assemble_cors_origins(cls, v: Any) -> List[str]:
         if isinstance(v, str):
             if v.startswith("[") and v.endswith("]"):
-                import json
                 try:
-                    return json.loads(v)
+                    return orjson.loads(v)
                 except Exception:
                     pass
             origins = [i.strip() for i in v.split(",")]
@@ -44,7 +45,7 @@ class Settings(BaseSettings):
     ROOM_CLEANUP_INTERVAL_SECONDS: int = 3600
     INACTIVE_ROOM_TIMEOUT_SECONDS: int = 7200
 
-    SENTRY_DSN: str | None = "https://3de78001d6efde50d11fa59d32009fe4@o4508014103232512.ingest.de.sentry.io/4510693152522320"
+    SENTRY_DSN: str | None = None
     SENTRY_TRACES_SAMPLE_RATE: float = 1.0
 
     model_config = SettingsConfigDict(
@@ -54,4 +55,10 @@ class Settings(BaseSettings):
     )
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings instance"""
+    return Settings()
+
+
+settings = get_settings()
@@ -3,14 +3,15 @@ from fastapi.middleware.cors import CORSMiddleware
 import socketio
 from contextlib import asynccontextmanager
 import asyncio
-import sentry_sdk
-from sentry_sdk.integrations.fastapi import FastApiIntegration
 
 from app.core.config import settings
-from app.websockets.game_handler import sio
+from app.websockets.game_handler import sio, install_redis_manager
 from app.services.room_manager import room_manager
 
-if settings.SENTRY_DSN:
+if settings.ENV == "production" and settings.SENTRY_DSN:
+    import sentry_sdk
+    from sentry_sdk.integrations.fastapi import FastApiIntegration
+
     sentry_sdk.init(
         dsn=settings.SENTRY_DSN,
         integrations=[FastApiIntegration()],
@@ -28,6 +29,7 @@ async def cleanup_task():
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifespan"""
+    await install_redis_manager()
     cleanup_task_handle = asyncio.create_task(cleanup_task())
     yield
     cleanup_task_handle.cancel()
@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field
-from typing import Literal, Optional
+from typing import Annotated, Literal, Optional
+from typing_extensions import TypedDict
 from datetime import datetime
 from enum import Enum
 
@@ -26,11 +27,17 @@ class Position(BaseModel):
     col: int = Field(..., ge=0, lt=20)
 
 
-class Piece(BaseModel):
+class PieceDict(TypedDict):
     color: PieceColor
     isKing: bool
 
 
+# Cells validate into plain dicts, so boards are relayed without building models
+BoardCell = Optional[PieceDict]
+BoardRow = Annotated[list[BoardCell], Field(max_length=20)]
+Board = Annotated[list[BoardRow], Field(max_length=20)]
+
+
 class MoveData(BaseModel):
     from_pos: Position = Field(..., alias="from")
     to: Position
@@ -46,18 +53,17 @@ class Player(BaseModel):
     color: PieceColor
     isReady: bool = False
     isConnected: bool = True
-    disconnectedAt: Optional[datetime] = None
 
 
 class GameRoom(BaseModel):
     id: str
     players: list[Player] = Field(default_factory=list, max_length=2)
-    board: Optional[list[list[Optional[Piece]]]] = None
+    # Relayed verbatim from the last move; the server never inspects it
+    board: Optional[Board] = None
     currentTurn: PieceColor = PieceColor.LIGHT
     status: GameStatus = GameStatus.WAITING
     variant: GameVariant
     createdAt: datetime = Field(default_factory=datetime.utcnow)
-    lastActivityAt: datetime = Field(default_factory=datetime.utcnow)
     winner: Optional[PieceColor] = None
 
 
@@ -84,7 +90,7 @@ class MakeMoveRequest(BaseModel):
     roomId: str
     playerId: str
     move: MoveData
-    newBoard: list[list[Optional[Piece]]]
+    newBoard: Board
     nextTurn: PieceColor
 
 
@@ -0,0 +1,100 @@
+from dataclasses import dataclass, field
+from typing import Any, Optional
+from datetime import datetime
+import time
+
+from pydantic import TypeAdapter
+
+from app.models.game import (
+    GameRoom,
+    Player,
+    PieceColor,
+    GameStatus,
+    GameVariant,
+)
+
+
+# JSON-mode serializers for each client-visible GameRoom field, used to
+# re-serialize a single dirty field exactly as a full model dump would
+_ROOM_FIELD_ADAPTERS = {
+    name: TypeAdapter(info.annotation) for name, info in GameRoom.model_fields.items()
+}
+
+
+# Server-side room state. These mirror the Pydantic models in app.models.game,
+# which are only built when a room is sent to clients.
+@dataclass(slots=True)
+class PlayerState:
+    id: str
+    name: str
+    color: PieceColor
+    isReady: bool = False
+    isConnected: bool = True
+    disconnectedAt: Optional[float] = None  # time.monotonic() stamp
+
+    def to_model(self) -> Player:
+        """Build the client-facing Player model"""
+        return Player.model_construct(
+            id=self.id,
+            name=self.name,
+            color=self.color,
+            isReady=self.isReady,
+            isConnected=self.isConnected,
+        )
+
+
+@dataclass(slots=True)
+class GameRoomState:
+    id: str
+    variant: GameVariant
+    players: list[PlayerState] = field(default_factory=list)
+    players_by_id: dict[str, PlayerState] = field(default_factory=dict)
+    ready_count: int = 0
+    board: Any = None
+    currentTurn: PieceColor = PieceColor.LIGHT
+    status: GameStatus = GameStatus.WAITING
+    createdAt: datetime = field(default_factory=datetime.utcnow)
+    lastActivityAt: float = field(default_factory=time.monotonic)
+    winner: Optional[PieceColor] = None
+    _dump_cache: Optional[dict] = field(default=None, init=False, repr=False)
+    _dirty_fields: set[str] = field(default_factory=set, init=False, repr=False)
+
+    def mark_dirty(self, *fields: str):
+        """Flag client-visible fields that changed since the last dump"""
+        unknown = set(fields).difference(_ROOM_FIELD_ADAPTERS)
+        if unknown:
+            raise ValueError(f"Unknown GameRoom fields: {sorted(unknown)}")
+        self._dirty_fields.update(fields)
+
+    def to_model(self) -> GameRoom:
+        """Build the client-facing GameRoom model"""
+        return GameRoom.model_construct(
+            id=self.id,
+            players=[p.to_model() for p in self.players],
+            board=self.board,
+            currentTurn=self.currentTurn,
+            status=self.status,
+            variant=self.variant,
+            createdAt=self.createdAt,
+            winner=self.winner,
+        )
+
+    def dump(self) -> dict:
+        """JSON-ready room payload; only fields marked dirty are re-serialized"""
+        if self._dump_cache is None:
+            self._dump_cache = self.to_model().model_dump(mode="json")
+        elif self._dirty_fields:
+            # Copy so payloads already handed out stay unchanged
+            data = dict(self._dump_cache)
+            for name in self._dirty_fields:
+                data[name] = self._dump_field(name)
+            self._dump_cache = data
+        self._dirty_fields.clear()
+        return self._dump_cache
+
+    def _dump_field(self, name: str) -> Any:
+        if name == "players":
+            value = [p.to_model() for p in self.players]
+        else:
+            value = getattr(self, name)
+        return _ROOM_FIELD_ADAPTERS[name].dump_python(value, mode="json")
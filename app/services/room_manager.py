@@ -1,40 +1,64 @@
+import heapq
 import secrets
-import string
-from datetime import datetime, timedelta
+import time
 from typing import Optional
 from app.models.game import (
-    GameRoom,
-    Player,
     PieceColor,
     GameStatus,
     GameVariant,
 )
+from app.models.state import GameRoomState, PlayerState
 from app.core.config import settings
 
+# Room code alphabet without the look-alike characters O, 0, I and 1.
+# 32 symbols, so a random byte modulo its length stays uniform.
+_ROOM_ALPHABET = b"ABCDEFGHJKLMNPQRSTUVWXYZ23456789"
+
+# Grace period before a disconnected player is removed from their room
+_DISCONNECT_TIMEOUT_SECONDS = 60
+
+
+def _now() -> float:
+    """Monotonic timestamp used for activity and disconnect tracking"""
+    return time.monotonic()
+
 
 class RoomManager:
     def __init__(self):
-        self.rooms: dict[str, GameRoom] = {}
+        self.rooms: dict[str, GameRoomState] = {}
         self.player_to_room: dict[str, str] = {}  # Track which room a player is in
+        # Min-heap of (deadline, room_id); entries are checked lazily on cleanup
+        self._expiry_heap: list[tuple[float, str]] = []
+        self._room_deadlines: dict[str, float] = {}  # Earliest live deadline per room
 
     def create_room(
         self, player_id: str, player_name: str, variant: GameVariant
-    ) -> GameRoom:
+    ) -> GameRoomState:
         """Create a new game room"""
         if len(self.rooms) >= settings.MAX_ROOMS:
             raise ValueError("Maximum room limit reached")
 
         room_id = self._generate_room_id()
-        player = Player(id=player_id, name=player_name, color=PieceColor.LIGHT)
-
-        room = GameRoom(id=room_id, players=[player], variant=variant)
+        # Inputs were validated by the request models at the websocket boundary
+        player = PlayerState(id=player_id, name=player_name, color=PieceColor.LIGHT)
+
+        room = GameRoomState(
+            id=room_id,
+            players=[player],
+            players_by_id={player_id: player},
+            variant=variant,
+            lastActivityAt=_now(),
+        )
 
         self.rooms[room_id] = room
         self.player_to_room[player_id] = room_id
+        self._schedule_expiry(
+            room_id, room.lastActivityAt + settings.INACTIVE_ROOM_TIMEOUT_SECONDS
+        )
 
         return room
 
-    def join_room(self, room_id: str, player_id: str, player_name: str) -> GameRoom:
+    def join_room(self, room_id: str, player_id: str, player_name: str) -> GameRoomState:
         """Join an existing room"""
         room = self.rooms.get(room_id)
 
@@ -42,12 +66,13 @@ class RoomManager:
             raise ValueError("Room not found")
 
         # Check if player is already in room (reconnection)
-        existing_player = next((p for p in room.players if p.id == player_id), None)
+        existing_player = room.players_by_id.get(player_id)
         if existing_player:
             existing_player.isConnected = True
             existing_player.disconnectedAt = None
             existing_player.name = player_name  # Update name if changed
-            room.lastActivityAt = datetime.utcnow()
+            room.lastActivityAt = _now()
+            room.mark_dirty("players")
             return room
 
         if room.status == GameStatus.FINISHED:
@@ -59,56 +84,51 @@ class RoomManager:
         if len(room.players) >= 2:
             raise ValueError("Room is full")
 
-        player = Player(
-            id=player_id, 
-            name=player_name, 
-            color=PieceColor.DARK,
-            isConnected=True
-        )
+        player = PlayerState(id=player_id, name=player_name, color=PieceColor.DARK)
         room.players.append(player)
-        room.lastActivityAt = datetime.utcnow()
+        room.players_by_id[player_id] = player
+        room.lastActivityAt = _now()
+        room.mark_dirty("players")
 
         self.player_to_room[player_id] = room_id
 
         return room
 
-    def get_room(self, room_id: str) -> Optional[GameRoom]:
+    def get_room(self, room_id: str) -> Optional[GameRoomState]:
         """Get room by ID"""
         room = self.rooms.get(room_id)
         if room:
-            room.lastActivityAt = datetime.utcnow()
+            room.lastActivityAt = _now()
         return room
 
-    def set_player_ready(self, room_id: str, player_id: str, ready: bool) -> bool:
-        """Set player ready status"""
+    def advance_ready(
+        self, room_id: str, player_id: str, ready: bool
+    ) -> tuple[Optional[GameRoomState], bool]:
+        """Set player ready status and report whether the game can start"""
         room = self.rooms.get(room_id)
         if not room:
-            return False
+            return None, False
 
-        player = next((p for p in room.players if p.id == player_id), None)
+        player = room.players_by_id.get(player_id)
         if not player:
-            return False
+            return None, False
 
+        if player.isReady != ready:
+            room.ready_count += 1 if ready else -1
         player.isReady = ready
-        room.lastActivityAt = datetime.utcnow()
-        return True
+        room.lastActivityAt = _now()
+        room.mark_dirty("players")
 
-    def can_start_game(self, room_id: str) -> bool:
-        """Check if game can start"""
-        room = self.rooms.get(room_id)
-        if not room:
-            return False
-
-        return len(room.players) == 2 and all(p.isReady for p in room.players)
+        return room, len(room.players) == 2 and room.ready_count == 2
 
     def start_game(self, room_id: str) -> bool:
-        """Start the game"""
-        if not self.can_start_game(room_id):
+        """Start the game once both players are ready"""
+        room = self.rooms.get(room_id)
+        if not room or len(room.players) != 2 or room.ready_count != 2:
             return False
 
-        room = self.rooms[room_id]
         room.status = GameStatus.PLAYING
-        room.lastActivityAt = datetime.utcnow()
+        room.mark_dirty("status")
         return True
 
     def update_game_state(
@@ -121,7 +141,8 @@ class RoomManager:
 
         room.board = board
         room.currentTurn = current_turn
-        room.lastActivityAt = datetime.utcnow()
+        room.lastActivityAt = _now()
+        room.mark_dirty("board", "currentTurn")
         return True
 
     def end_game(self, room_id: str, winner: Optional[PieceColor]) -> bool:
@@ -132,31 +153,38 @@ class RoomManager:
 
         room.status = GameStatus.FINISHED
         room.winner = winner
-        room.lastActivityAt = datetime.utcnow()
+        room.lastActivityAt = _now()
+        room.mark_dirty("status", "winner")
         return True
 
-    def remove_player(self, room_id: str, player_id: str) -> Optional[GameRoom]:
+    def remove_player(self, room_id: str, player_id: str) -> Optional[GameRoomState]:
         """Remove a player from a room"""
         room = self.rooms.get(room_id)
         if not room:
             return None
 
-        room.players = [p for p in room.players if p.id != player_id]
+        player = room.players_by_id.pop(player_id, None)
+        if player:
+            if player.isReady:
+                room.ready_count -= 1
+            room.players = [p for p in room.players if p.id != player_id]
+            room.mark_dirty("players")
         self.player_to_room.pop(player_id, None)
 
         # Delete room if empty
         if len(room.players) == 0:
             self.rooms.pop(room_id, None)
+            self._room_deadlines.pop(room_id, None)
             return None
 
-        room.lastActivityAt = datetime.utcnow()
+        room.lastActivityAt = _now()
         return room
 
     def get_player_room(self, player_id: str) -> Optional[str]:
         """Get the room ID for a player"""
         return self.player_to_room.get(player_id)
 
-    def handle_disconnect(self, player_id: str) -> Optional[GameRoom]:
+    def handle_disconnect(self, player_id: str) -> Optional[GameRoomState]:
         """Handle player disconnection (mark as disconnected)"""
         room_id = self.player_to_room.get(player_id)
         if not room_id:
@@ -166,34 +194,46 @@ class RoomManager:
         if not room:
             return None
 
-        player = next((p for p in room.players if p.id == player_id), None)
+        player = room.players_by_id.get(player_id)
         if player:
             player.isConnected = False
-            player.disconnectedAt = datetime.utcnow()
-            room.lastActivityAt = datetime.utcnow()
+            now = _now()
+            player.disconnectedAt = now
+            room.lastActivityAt = now
+            room.mark_dirty("players")
+            self._schedule_expiry(room_id, now + _DISCONNECT_TIMEOUT_SECONDS)
 
         return room
 
     def cleanup_inactive_rooms(self):
-        """Remove inactive rooms and disconnected players"""
-        now = datetime.utcnow()
-        inactive_timeout = timedelta(seconds=settings.INACTIVE_ROOM_TIMEOUT_SECONDS)
-        disconnect_timeout = timedelta(seconds=60)  # 60 seconds grace period
+        """Remove inactive rooms and disconnected players whose deadline has passed"""
+        now = _now()
+        inactive_timeout = settings.INACTIVE_ROOM_TIMEOUT_SECONDS
+
+        rooms_to_delete: set[str] = set()
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            deadline, room_id = heapq.heappop(self._expiry_heap)
+            # Skip entries superseded by an earlier deadline
+            if self._room_deadlines.get(room_id) != deadline:
+                continue
+            del self._room_deadlines[room_id]
+
+            room = self.rooms.get(room_id)
+            if not room:
+                continue
 
-        rooms_to_delete = []
-        for room_id, room in self.rooms.items():
             # Check room inactivity
-            if now - room.lastActivityAt > inactive_timeout:
-                rooms_to_delete.append(room_id)
+            if room.lastActivityAt + inactive_timeout <= now:
+                rooms_to_delete.add(room_id)
                 continue
 
             # Check for disconnected players timeout
             # If a player has been disconnected for too long, consider them left
             disconnected_players = [
-                p for p in room.players 
-                if not p.isConnected and p.disconnectedAt and (now - p.disconnectedAt > disconnect_timeout)
+                p for p in room.players
+                if not p.isConnected and p.disconnectedAt is not None and (p.disconnectedAt + _DISCONNECT_TIMEOUT_SECONDS <= now)
             ]
-            
+
             for player in disconnected_players:
                 # If game is playing and player times out, they forfeit?
                 # For now, just remove them which might end game or close room
@@ -201,23 +241,36 @@ class RoomManager:
 
             # If room became empty after removing players
             if len(room.players) == 0:
-                rooms_to_delete.append(room_id)
+                rooms_to_delete.add(room_id)
+                continue
 
-        for room_id in list(set(rooms_to_delete)):  # unique IDs
+            # Room is still alive: check it again at its next deadline
+            next_deadline = room.lastActivityAt + inactive_timeout
+            for p in room.players:
+                if not p.isConnected and p.disconnectedAt is not None:
+                    next_deadline = min(next_deadline, p.disconnectedAt + _DISCONNECT_TIMEOUT_SECONDS)
+            self._schedule_expiry(room_id, next_deadline)
+
+        for room_id in rooms_to_delete:
             room = self.rooms.pop(room_id, None)
+            self._room_deadlines.pop(room_id, None)
             if room:
                 for player in room.players:
                     self.player_to_room.pop(player.id, None)
 
         return len(rooms_to_delete)
 
+    def _schedule_expiry(self, room_id: str, deadline: float):
+        """Make sure the room is checked no later than the given deadline"""
+        if deadline < self._room_deadlines.get(room_id, float("inf")):
+            self._room_deadlines[room_id] = deadline
+            heapq.heappush(self._expiry_heap, (deadline, room_id))
+
     def _generate_room_id(self) -> str:
         """Generate a unique 6-character room code"""
-        chars = string.ascii_uppercase + string.digits
-        chars = chars.replace("O", "").replace("0", "").replace("I", "").replace("1", "")
-
         while True:
-            room_id = "".join(secrets.choice(chars) for _ in range(6))
+            raw = secrets.token_bytes(6)
+            room_id = bytes(_ROOM_ALPHABET[b % 32] for b in raw).decode()
             if room_id not in self.rooms:
                 return room_id
 
@@ -1,4 +1,7 @@
 import socketio
+import orjson
+from pydantic import TypeAdapter
+from types import SimpleNamespace
 from app.core.config import settings
 from app.services.room_manager import room_manager
 from app.models.game import (
@@ -13,26 +16,57 @@ from app.models.game import (
 )
 
 
-client_manager = None
-if settings.REDIS_URL:
-    try:
-        import redis
-        r = redis.from_url(settings.REDIS_URL, socket_connect_timeout=1)
-        r.ping()
-        client_manager = socketio.AsyncRedisManager(settings.REDIS_URL)
-    except Exception:
-        # Fallback to default manager if Redis is not reachable
-        pass
+# Validators are compiled once at import and reused for every event
+_CREATE_ROOM = TypeAdapter(CreateRoomRequest)
+_JOIN_ROOM = TypeAdapter(JoinRoomRequest)
+_PLAYER_READY = TypeAdapter(PlayerReadyRequest)
+_MAKE_MOVE = TypeAdapter(MakeMoveRequest)
+_GAME_OVER = TypeAdapter(GameOverRequest)
+_LEAVE_ROOM = TypeAdapter(LeaveRoomRequest)
+
+# Enum members bound once so handlers skip the class attribute lookup
+_PLAYING = GameStatus.PLAYING
+_DARK = PieceColor.DARK
+_LIGHT = PieceColor.LIGHT
+
+_OPPONENT = {_DARK: _LIGHT, _LIGHT: _DARK}
+
+# Socket.IO/Engine.IO call dumps(obj, separators=...) and expect a str back
+orjson_codec = SimpleNamespace(
+    dumps=lambda obj, *args, **kwargs: orjson.dumps(obj).decode(),
+    loads=orjson.loads,
+)
 
 sio = socketio.AsyncServer(
     async_mode="asgi",
+    json=orjson_codec,
     cors_allowed_origins=settings.CORS_ORIGINS,
-    client_manager=client_manager,
     logger=settings.ENV == "development",
     engineio_logger=settings.ENV == "development",
 )
 
 
+async def install_redis_manager():
+    """Switch sio to a Redis-backed client manager in production when Redis is reachable"""
+    if settings.ENV != "production" or not settings.REDIS_URL:
+        return
+
+    try:
+        from redis import asyncio as aioredis
+        r = aioredis.from_url(settings.REDIS_URL, socket_connect_timeout=1)
+        try:
+            await r.ping()
+        finally:
+            await r.aclose()
+    except Exception:
+        # Fallback to default manager if Redis is not reachable
+        return
+
+    client_manager = socketio.AsyncRedisManager(settings.REDIS_URL)
+    sio.manager = client_manager
+    client_manager.set_server(sio)
+
+
 @sio.event
 async def connect(sid, environ):
     pass
@@ -48,10 +82,10 @@ async def disconnect(sid, reason=None):
     room_id, player_id = sid_map[sid]
 
     room = room_manager.get_room(room_id)
-    if room and room.status == GameStatus.PLAYING:
-        player = next((p for p in room.players if p.id == player_id), None)
+    if room and room.status == _PLAYING:
+        player = room.players_by_id.get(player_id)
         if player:
-            winner_color = PieceColor.LIGHT if player.color == PieceColor.DARK else PieceColor.DARK
+            winner_color = _OPPONENT[player.color]
             room_manager.end_game(room_id, winner_color)
             await sio.emit(
                 "gameEnded",
@@ -67,7 +101,7 @@ async def disconnect(sid, reason=None):
 async def createRoom(sid, data):
     """Create a new game room"""
     try:
-        request = CreateRoomRequest(**data)
+        request = _CREATE_ROOM.validate_python(data)
         room = room_manager.create_room(
             request.playerId, request.playerName, request.variant
         )
@@ -78,7 +112,7 @@ async def createRoom(sid, data):
         return {
             "success": True,
             "roomId": room.id,
-            "room": room.model_dump(mode="json"),
+            "room": room.dump(),
         }
 
     except ValueError as e:
@@ -91,7 +125,7 @@ async def createRoom(sid, data):
 async def joinRoom(sid, data):
     """Join an existing game room"""
     try:
-        request = JoinRoomRequest(**data)
+        request = _JOIN_ROOM.validate_python(data)
         room = room_manager.join_room(
             request.roomId, request.playerId, request.playerName
         )
@@ -99,15 +133,19 @@ async def joinRoom(sid, data):
         await sio.enter_room(sid, request.roomId)
         sid_map[sid] = (request.roomId, request.playerId)
 
-        event_name = "playerReconnected" if any(p.id == request.playerId and p.isConnected for p in room.players) else "playerJoined"
-        
+        player = room.players_by_id[request.playerId]
+        event_name = "playerReconnected" if player.isConnected else "playerJoined"
+
+        # Serialize once and share between the broadcast and the ack
+        room_data = room.dump()
+
         await sio.emit(
             event_name,
-            {"room": room.model_dump(mode="json"), "player": next(p for p in room.players if p.id == request.playerId).model_dump(mode="json")},
+            {"room": room_data, "player": player.to_model().model_dump(mode="json")},
             room=request.roomId,
         )
 
-        return {"success": True, "room": room.model_dump(mode="json")}
+        return {"success": True, "room": room_data}
 
     except ValueError as e:
         return {"success": False, "error": str(e)}
@@ -119,29 +157,25 @@ async def joinRoom(sid, data):
 async def playerReady(sid, data):
     """Mark player as ready"""
     try:
-        request = PlayerReadyRequest(**data)
-        success = room_manager.set_player_ready(
+        request = _PLAYER_READY.validate_python(data)
+        room, can_start = room_manager.advance_ready(
             request.roomId, request.playerId, request.ready
         )
 
-        if not success:
+        if not room:
             return {"success": False, "error": "Failed to set ready status"}
 
-        room = room_manager.get_room(request.roomId)
-
         # Notify all players
         await sio.emit(
             "playerReadyUpdate",
-            {"room": room.model_dump(mode="json")},
+            {"room": room.dump()},
             room=request.roomId,
         )
 
-        if room_manager.can_start_game(request.roomId):
-            room_manager.start_game(request.roomId)
-            room = room_manager.get_room(request.roomId)
+        if can_start and room_manager.start_game(request.roomId):
             await sio.emit(
                 "gameStart",
-                {"room": room.model_dump(mode="json")},
+                {"room": room.dump()},
                 room=request.roomId,
             )
 
@@ -156,29 +190,25 @@ async def playerReady(sid, data):
 async def makeMove(sid, data):
     """Handle a player making a move"""
     try:
-        request = MakeMoveRequest(**data)
+        request = _MAKE_MOVE.validate_python(data)
         room = room_manager.get_room(request.roomId)
 
         if not room:
             return {"success": False, "error": "Room not found"}
 
-        player = next((p for p in room.players if p.id == request.playerId), None)
+        player = room.players_by_id.get(request.playerId)
         if not player or player.color != room.currentTurn:
             return {"success": False, "error": "Not your turn"}
 
         room_manager.update_game_state(
             request.roomId, request.newBoard, request.nextTurn
         )
-        serialized_board = [
-            [piece.model_dump(mode="json") if piece else None for piece in row]
-            for row in request.newBoard
-        ]
 
         await sio.emit(
             "moveMade",
             {
                 "move": request.move.model_dump(mode="json"),
-                "board": serialized_board,
+                "board": request.newBoard,
                 "currentTurn": request.nextTurn.value,
                 "playerId": request.playerId,
             },
@@ -195,7 +225,7 @@ async def makeMove(sid, data):
 async def gameOver(sid, data):
     """Handle game over"""
     try:
-        request = GameOverRequest(**data)
+        request = _GAME_OVER.validate_python(data)
         room_manager.end_game(request.roomId, request.winner)
 
         await sio.emit(
@@ -213,13 +243,13 @@ async def gameOver(sid, data):
 @sio.event
 async def leaveRoom(sid, data):
     try:
-        request = LeaveRoomRequest(**data)
+        request = _LEAVE_ROOM.validate_python(data)
 
         room = room_manager.get_room(request.roomId)
-        if room and room.status == GameStatus.PLAYING:
-            player = next((p for p in room.players if p.id == request.playerId), None)
+        if room and room.status == _PLAYING:
+            player = room.players_by_id.get(request.playerId)
             if player:
-                winner_color = PieceColor.LIGHT if player.color == PieceColor.DARK else PieceColor.DARK
+                winner_color = _OPPONENT[player.color]
                 room_manager.end_game(request.roomId, winner_color)
                 await sio.emit(
                     "gameEnded",
@@ -233,7 +263,7 @@ async def leaveRoom(sid, data):
         if room:
             await sio.emit(
                 "playerLeft",
-                {"room": room.model_dump(mode="json"), "playerId": request.playerId},
+                {"room": room.dump(), "playerId": request.playerId},
                 room=request.roomId,
             )
 
@@ -1,3 +1,4 @@
+import sys
 import uvicorn
 from app.core.config import settings
 
@@ -7,5 +8,8 @@ if __name__ == "__main__":
         host=settings.HOST,
         port=settings.PORT,
         reload=settings.ENV == "development",
+        loop="uvloop" if sys.platform != "win32" else "asyncio",
+        http="httptools",
+        ws="websockets",
         log_level="info",
     )
@@ -0,0 +1,99 @@
+import pytest
+
+import app.services.room_manager as room_manager_module
+from app.core.config import settings
+from app.models.game import GameVariant
+from app.services.room_manager import RoomManager
+
+
+INACTIVE_TIMEOUT = settings.INACTIVE_ROOM_TIMEOUT_SECONDS
+GRACE = room_manager_module._DISCONNECT_TIMEOUT_SECONDS
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(room_manager_module, "_now", clock)
+    return clock
+
+
+@pytest.fixture
+def manager(clock):
+    return RoomManager()
+
+
+def test_reconnect_then_disconnect_restarts_grace_period(manager, clock):
+    room = manager.create_room("p1", "Alice", GameVariant.AMERICAN)
+    manager.join_room(room.id, "p2", "Bob")
+
+    manager.handle_disconnect("p2")
+    clock.advance(10)
+    manager.join_room(room.id, "p2", "Bob")
+    clock.advance(10)
+    manager.handle_disconnect("p2")
+
+    # The first disconnect's deadline passes, but the second one is still in grace
+    clock.advance(GRACE - 5)
+    manager.cleanup_inactive_rooms()
+    assert "p2" in room.players_by_id
+
+    clock.advance(5)
+    manager.cleanup_inactive_rooms()
+    assert "p2" not in room.players_by_id
+    assert manager.get_player_room("p2") is None
+    assert room.id in manager.rooms
+
+
+def test_disconnected_player_removed_after_grace_period(manager, clock):
+    room = manager.create_room("p1", "Alice", GameVariant.AMERICAN)
+    manager.join_room(room.id, "p2", "Bob")
+    manager.handle_disconnect("p2")
+
+    clock.advance(GRACE - 1)
+    manager.cleanup_inactive_rooms()
+    assert [p.id for p in room.players] == ["p1", "p2"]
+
+    clock.advance(1)
+    manager.cleanup_inactive_rooms()
+    assert [p.id for p in room.players] == ["p1"]
+
+
+def test_activity_pushes_back_inactivity_timeout(manager, clock):
+    room = manager.create_room("p1", "Alice", GameVariant.AMERICAN)
+
+    clock.advance(INACTIVE_TIMEOUT - 100)
+    manager.get_room(room.id)
+
+    clock.advance(100)
+    assert manager.cleanup_inactive_rooms() == 0
+    assert room.id in manager.rooms
+
+    clock.advance(INACTIVE_TIMEOUT - 100)
+    assert manager.cleanup_inactive_rooms() == 1
+    assert room.id not in manager.rooms
+    assert manager.get_player_room("p1") is None
+    assert manager._room_deadlines == {}
+
+
+def test_removing_last_player_forgets_room_deadline(manager, clock):
+    room = manager.create_room("p1", "Alice", GameVariant.AMERICAN)
+
+    assert manager.remove_player(room.id, "p1") is None
+    assert room.id not in manager.rooms
+    assert manager._room_deadlines == {}
+
+    # The stale heap entry is discarded once its deadline passes
+    clock.advance(INACTIVE_TIMEOUT)
+    assert manager.cleanup_inactive_rooms() == 0
+    assert manager._expiry_heap == []
@@ -0,0 +1,43 @@
+import pytest
+
+from app.models.game import GameVariant, PieceColor
+from app.services.room_manager import RoomManager
+
+
+# Shaped like a validated MakeMoveRequest.newBoard
+BOARD = [
+    [None, {"color": PieceColor.DARK, "isKing": False}],
+    [{"color": PieceColor.LIGHT, "isKing": True}, None],
+]
+
+
+def assert_dump_matches(room):
+    assert room.dump() == room.to_model().model_dump(mode="json")
+
+
+def test_incremental_dump_matches_full_dump_after_each_mutation():
+    manager = RoomManager()
+    room = manager.create_room("p1", "Alice", GameVariant.AMERICAN)
+    assert_dump_matches(room)
+
+    mutations = [
+        lambda: manager.join_room(room.id, "p2", "Bob"),
+        lambda: manager.advance_ready(room.id, "p1", True),
+        lambda: manager.advance_ready(room.id, "p2", True),
+        lambda: manager.start_game(room.id),
+        lambda: manager.update_game_state(room.id, BOARD, PieceColor.DARK),
+        lambda: manager.handle_disconnect("p2"),
+        lambda: manager.join_room(room.id, "p2", "Bobby"),
+        lambda: manager.end_game(room.id, PieceColor.LIGHT),
+        lambda: manager.remove_player(room.id, "p2"),
+    ]
+    for mutate in mutations:
+        mutate()
+        assert_dump_matches(room)
+
+
+def test_mark_dirty_rejects_unknown_fields():
+    room = RoomManager().create_room("p1", "Alice", GameVariant.AMERICAN)
+
+    with pytest.raises(ValueError):
+        room.mark_dirty("player")